@@ -0,0 +1,60 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for Shreelock Video Player - build with: python build.py
+
+# Stdlib modules the player never uses. tkinter (GUI) and email (needed by
+# http.client for the VLC download) must stay in the bundle.
+excluded_modules = [
+    'unittest',
+    'test',
+    'pydoc',
+    'pydoc_data',
+    'xmlrpc',
+    'distutils',
+    'http.server',
+    'lib2to3',
+]
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    # libvlc and its plugins are deliberately not bundled - the app finds (or
+    # downloads) the system VLC install at runtime, so COLLECT stays small.
+    binaries=[],
+    datas=[],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=excluded_modules,
+    noarchive=False,
+    optimize=1,  # Strips asserts from every bundled pure module (stdlib, tkinter, python-vlc too)
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,  # One-folder build - no temp extraction on every launch
+    name='ShreelockVideoPlayer',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=False,  # Hide console window
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    contents_directory='_internal',
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='ShreelockVideoPlayer',
+)
@@ -6,55 +6,510 @@ Creates standalone executable with PyInstaller
 import subprocess
 import sys
 import os
+import importlib.util
+import importlib.metadata
+import hashlib
+import shutil
+import stat
+import ctypes
+import concurrent.futures
+import glob
+import tempfile
+import compileall
+import sysconfig
+import io
+import contextlib
+import asyncio
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+
+APP_NAME = "ShreelockVideoPlayer"
+
+# Local cache for build artifacts that survive between runs (CI can cache this dir)
+BUILD_CACHE_DIR = ".build_cache"
+PYINSTALLER_VERSION = "6.6.0"  # Keep in sync with requirements.txt
+# Repo-local pip cache so CI can persist downloaded wheels (e.g. with actions/cache)
+PIP_CACHE_DIR = os.path.join(BUILD_CACHE_DIR, "pip-wheels")
+# Persistent PyInstaller workpath so Analysis/PYZ/PKG TOCs are reused across runs.
+# PyInstaller invalidates these itself when the Python version or main.py changes.
+PYI_WORKPATH = os.path.join(BUILD_CACHE_DIR, "pyi-work")
+DIST_PATH = "dist"
+BUILD_HASH_FILE = os.path.join(BUILD_CACHE_DIR, "last_build.hash")
+# Present once the interpreter's stdlib/site-packages bytecode has been compiled
+PYCACHE_WARMED_MARKER = os.path.join(BUILD_CACHE_DIR, "pycache_warmed.marker")
+# Local build server (python build.py --server) kept warm between rebuilds
+BUILD_SERVER_ADDRESS = ("127.0.0.1", 54545)
+# Random per-checkout key shared by --server and --client (SHREELOCK_BUILD_AUTHKEY overrides it)
+BUILD_SERVER_KEY_FILE = os.path.join(BUILD_CACHE_DIR, "build_server.key")
+# Nuitka keeps compiled C objects here, keyed by file checksum
+NUITKA_CACHE_DIR = os.path.join(BUILD_CACHE_DIR, "nuitka")
+# Build variants as (name, extra_args, workpath, distpath). Each variant is built
+# from its committed "<name>.spec" file and gets an isolated workpath/distpath so
+# several can be built side by side.
+BUILD_VARIANTS = [
+    (APP_NAME, [], PYI_WORKPATH, DIST_PATH),
+]
+# Directories never considered part of the app sources
+SOURCE_EXCLUDE_DIRS = {BUILD_CACHE_DIR, DIST_PATH, "build", ".git", ".venv", "venv", "__pycache__"}
+
+def _pyinstaller_is_installed():
+    """True if PyInstaller is available, without importing it"""
+    # Check the installed distribution against the pin without importing PyInstaller
+    try:
+        installed_version = importlib.metadata.version("pyinstaller")
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    
+    if installed_version != PYINSTALLER_VERSION:
+        print(f"PyInstaller {installed_version} found, {PYINSTALLER_VERSION} required")
+        return False
+    
+    print("PyInstaller is already installed")
+    return True
+
+def _pip_install_commands():
+    """pip commands needed to install PyInstaller, in order"""
+    pip_cmd = [
+        sys.executable, "-m", "pip", "install",
+        "--cache-dir", PIP_CACHE_DIR,
+        "--prefer-binary",              # Use cached wheels instead of building
+        "--no-input",
+        "--disable-pip-version-check",
+    ]
+    
+    commands = []
+    # With 'wheel' present pip caches wheels it builds from sdists too
+    if importlib.util.find_spec("wheel") is None:
+        commands.append(pip_cmd + ["wheel"])
+    commands.append(pip_cmd + ["--only-binary=:all:", f"pyinstaller=={PYINSTALLER_VERSION}"])
+    return commands
 
 def install_pyinstaller():
     """Install PyInstaller if not already installed"""
+    if _pyinstaller_is_installed():
+        return
+    
+    print("Installing PyInstaller...")
+    for cmd in _pip_install_commands():
+        # close_fds=False: our fds are non-inheritable anyway (PEP 446), and it
+        # skips closing every descriptor up to the fd limit before the spawn
+        subprocess.check_call(cmd, close_fds=False)
+
+async def install_pyinstaller_async():
+    """install_pyinstaller() that awaits pip instead of blocking on it"""
+    if _pyinstaller_is_installed():
+        return
+    
+    print("Installing PyInstaller...")
+    for cmd in _pip_install_commands():
+        process = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.DEVNULL, close_fds=False)
+        if await process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+
+def check_vlc():
+    """Check whether the VLC engine is available on this machine"""
+    if shutil.which("vlc"):
+        return True
+    
+    if sys.platform == "win32":
+        for env_var in ("PROGRAMFILES", "PROGRAMFILES(X86)"):
+            program_files = os.environ.get(env_var)
+            if program_files and os.path.exists(os.path.join(program_files, "VideoLAN", "VLC", "libvlc.dll")):
+                return True
+    
+    lib_name = "libvlc.dll" if sys.platform == "win32" else "libvlc.so.5"
+    try:
+        ctypes.CDLL(lib_name)
+        return True
+    except OSError:
+        return False
+
+def hash_sources(root="."):
+    """Hash all project .py files (used as the build cache key)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SOURCE_EXCLUDE_DIRS)
+        for name in sorted(filenames):
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(dirpath, name)
+            digest.update(os.path.relpath(path, root).encode("utf-8"))
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+def compute_build_key(source_hash):
+    """Combine sources, requirements, spec files, Python and PyInstaller versions into one key"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(source_hash.encode("utf-8"))
+    for path in sorted(glob.glob("requirements*.txt") + glob.glob("*.spec")):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    digest.update(sys.version.encode("utf-8"))
+    try:
+        digest.update(importlib.metadata.version("pyinstaller").encode("utf-8"))
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    return digest.hexdigest()
+
+def is_build_up_to_date(build_key):
+    """True if the last successful build used the same key and its output still exists"""
+    for name, _, _, distpath in BUILD_VARIANTS:
+        if not os.path.exists(os.path.join(distpath, f"{name}.zip")):
+            return False
+    try:
+        with open(BUILD_HASH_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip() == build_key
+    except OSError:
+        return False
+
+def save_build_key(build_key):
+    """Atomically record the key of a successful build"""
+    os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+    temp_path = BUILD_HASH_FILE + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(build_key)
+    os.replace(temp_path, BUILD_HASH_FILE)
+
+def warm_bytecode_cache():
+    """Precompile stdlib and site-packages once so Analysis doesn't compile on import"""
+    # The marker holds sys.version, so a Python upgrade warms the cache again
+    try:
+        with open(PYCACHE_WARMED_MARKER, "r", encoding="utf-8") as f:
+            if f.read() == sys.version:
+                return
+    except OSError:
+        pass
+    
+    paths = sysconfig.get_paths()
+    for library_dir in sorted({paths["stdlib"], paths["purelib"], paths["platlib"]}):
+        if os.path.isdir(library_dir):
+            # Read-only system installs just fail quietly here
+            compileall.compile_dir(library_dir, quiet=2, workers=0)
+    
+    os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+    with open(PYCACHE_WARMED_MARKER, "w", encoding="utf-8") as f:
+        f.write(sys.version)
+
+async def _run_preflight_steps():
+    """Overlap pip's network I/O with source hashing, then warm the bytecode cache"""
+    _, source_hash = await asyncio.gather(
+        install_pyinstaller_async(),
+        asyncio.to_thread(hash_sources),
+    )
+    # compileall walks site-packages, so it must not run while pip is writing to it
+    await asyncio.to_thread(warm_bytecode_cache)
+    return source_hash
+
+def run_preflight():
+    """Run the independent pre-build checks concurrently"""
+    source_hash = asyncio.run(_run_preflight_steps())
+    print(f"🔑 Source hash: {source_hash}")
+    return source_hash
+
+def print_troubleshooting():
+    """Print common fixes for a failed build"""
+    print("\nTroubleshooting tips:")
+    print("1. Make sure VLC is installed on your system")
+    print("2. Check that all dependencies are installed")
+    print("3. Try running: pip install --upgrade pyinstaller")
+
+def run_pyinstaller(pyi_args):
+    """Run PyInstaller in-process (set PYI_SUBPROCESS=1 to spawn it instead)"""
+    if os.environ.get("PYI_SUBPROCESS") == "1":
+        # Same interpreter as install_pyinstaller(), no PATH lookup or .exe shim
+        cmd = [sys.executable, "-m", "PyInstaller", *pyi_args]
+        if os.environ.get("VERBOSE") != "1":
+            subprocess.check_call(cmd, close_fds=False)
+            return
+        
+        # Forward the chatty log in 64KB chunks instead of one console write per line
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=65536, close_fds=False
+        )
+        for chunk in iter(lambda: process.stdout.read(65536), b""):
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.flush()
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+        return
+    
+    from PyInstaller.__main__ import run
+    try:
+        run(pyi_args)
+    except SystemExit as e:
+        # PyInstaller reports failures through sys.exit()
+        if e.code not in (None, 0):
+            raise subprocess.CalledProcessError(e.code, ["PyInstaller", *pyi_args])
+
+def clear_stale_bytecode(root="."):
+    """Remove project __pycache__ dirs so no stale .pyc ends up in the bundle"""
+    for dirpath, dirnames, _ in os.walk(root):
+        if "__pycache__" in dirnames:
+            shutil.rmtree(os.path.join(dirpath, "__pycache__"), ignore_errors=True)
+        dirnames[:] = [d for d in dirnames if d not in SOURCE_EXCLUDE_DIRS]
+
+def _ram_backed_workpath(name, workpath):
+    """Move the workpath onto tmpfs (/dev/shm) on Linux, linked from its usual place"""
+    if not sys.platform.startswith("linux") or not os.path.isdir("/dev/shm"):
+        return None
+    
+    # Per-user directory: /dev/shm is shared by everyone on the machine
+    ram_workpath = os.path.join("/dev/shm", f"shreelock-{os.getuid()}-{name}-pyi-work")
+    # The name is predictable, so only trust a real 0700 directory we own; anything
+    # another user planted there first would let them feed files into the bundle
+    try:
+        os.makedirs(ram_workpath, mode=0o700, exist_ok=True)
+        st = os.lstat(ram_workpath)
+        trusted = (stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid()
+                   and stat.S_IMODE(st.st_mode) == 0o700)
+    except OSError:
+        trusted = False
+    if not trusted:
+        print(f"⚠️ {ram_workpath} is not a private directory, using {workpath}")
+        if os.path.islink(workpath):
+            os.remove(workpath)  # Don't follow an old link into it
+        return None
+    
+    # Keep the cache reachable at the usual path so warm rebuilds still find it
+    if os.path.islink(workpath):
+        if os.path.realpath(workpath) == os.path.realpath(ram_workpath):
+            return ram_workpath
+        os.remove(workpath)
+    elif os.path.isdir(workpath):
+        shutil.rmtree(workpath, ignore_errors=True)
+    os.makedirs(os.path.dirname(workpath) or ".", exist_ok=True)
     try:
-        import PyInstaller
-        print("PyInstaller is already installed")
-    except ImportError:
-        print("Installing PyInstaller...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        os.symlink(ram_workpath, workpath, target_is_directory=True)
+    except OSError:
+        pass
+    return ram_workpath
 
-def build_simple_app():
+def build_simple_app(variant=BUILD_VARIANTS[0]):
     """Build simple portable application"""
-    print("Building simple portable application...")
+    name, extra_args, workpath, distpath = variant
+    print(f"Building simple portable application ({name})...")
     
-    # PyInstaller command for simple portable app
-    cmd = [
-        "pyinstaller",
-        "--onefile",                    # Create single executable file
-        "--windowed",                   # Hide console window
-        "--name=ShreelockVideoPlayer",  # Executable name
-        "main.py"
+    # Intermediate .toc/.pyc/.pkg files are hundreds of MB - keep them in RAM when possible
+    ram_workpath = _ram_backed_workpath(name, workpath)
+    if ram_workpath:
+        workpath = ram_workpath
+    
+    # PyInstaller arguments for simple portable app - bundle options live in the .spec
+    pyi_args = [
+        f"{name}.spec",
+        "--workpath", workpath,         # Reuse cached analysis between builds
+        "--distpath", distpath,
+        "--noconfirm",
+        # Thousands of INFO lines slow down the Windows console; VERBOSE=1 brings them back
+        "--log-level=INFO" if os.environ.get("VERBOSE") == "1" else "--log-level=WARN",
+        *extra_args,
     ]
     
+    # Only wipe the analysis cache when explicitly requested
+    if os.environ.get("FORCE_CLEAN") == "1":
+        pyi_args.insert(0, "--clean")
+    
+    # Optional UPX compression of the collected binaries
+    upx_dir = os.environ.get("UPX_DIR")
+    if upx_dir:
+        pyi_args.append(f"--upx-dir={upx_dir}")
+    
+    os.makedirs(workpath, exist_ok=True)
+    
     try:
-        subprocess.check_call(cmd)
+        run_pyinstaller(pyi_args)
+        
+        # Zip the app folder for distribution - users unzip once, launch many times
+        archive_path = shutil.make_archive(os.path.join(distpath, name), "zip", distpath, name)
+        
+        # Keep the warm cache; FREE_WORK=1 gives the tmpfs memory back instead
+        if ram_workpath and os.environ.get("FREE_WORK") == "1":
+            shutil.rmtree(ram_workpath, ignore_errors=True)
+            if os.path.islink(variant[2]):
+                os.remove(variant[2])  # Don't leave a dangling link behind
+        
         print("\n✅ Build successful!")
-        print("📁 Executable location: dist/ShreelockVideoPlayer.exe")
-        print("📦 Single file - ready to distribute!")
+        print(f"📁 Executable location: {distpath}/{name}/{name}.exe")
+        print(f"📦 Distribution archive: {archive_path}")
         print("💡 Users can:")
-        print("   • Double-click to run immediately")
+        print("   • Unzip once and double-click to run")
         print("   • No installation required")
         print("   • Create shortcuts manually if needed")
+        return True
         
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed: {e}")
-        print("\nTroubleshooting tips:")
-        print("1. Make sure VLC is installed on your system")
-        print("2. Check that all dependencies are installed")
-        print("3. Try running: pip install --upgrade pyinstaller")
+        print_troubleshooting()
+        return False
+
+def build_nuitka():
+    """Build a standalone app with Nuitka (select with BUILDER=nuitka)"""
+    if importlib.util.find_spec("nuitka") is None:
+        print("❌ Nuitka is not installed. Run: pip install nuitka")
+        return False
+    
+    print("Building standalone application with Nuitka...")
+    cmd = [
+        sys.executable, "-m", "nuitka",
+        "--standalone",                     # Folder build, same layout as PyInstaller's
+        "--enable-plugin=tk-inter",
+        "--windows-console-mode=disable",   # Hide console window
+        f"--output-dir={DIST_PATH}",
+        f"--output-filename={APP_NAME}",
+        "--assume-yes-for-downloads",
+        "main.py"
+    ]
+    
+    # Unchanged modules are reused from the cache, so warm rebuilds only relink
+    env = dict(os.environ, NUITKA_CACHE_DIR=os.path.abspath(NUITKA_CACHE_DIR))
+    os.makedirs(NUITKA_CACHE_DIR, exist_ok=True)
+    
+    try:
+        subprocess.check_call(cmd, env=env, close_fds=False)
+        print("\n✅ Build successful!")
+        print(f"📁 Executable location: {DIST_PATH}/main.dist/{APP_NAME}.exe")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Build failed: {e}")
+        return False
+
+def _build_variant_in_worker(variant):
+    """Process pool entry point: build one variant with a private TMPDIR"""
+    temp_dir = tempfile.mkdtemp(prefix=f"pyi-{variant[0]}-")
+    os.environ["TMPDIR"] = os.environ["TEMP"] = os.environ["TMP"] = temp_dir
+    tempfile.tempdir = None  # Re-read the environment on next use
+    try:
+        return build_simple_app(variant)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def build_all_variants(variants=BUILD_VARIANTS):
+    """Build every variant, in parallel when there is more than one"""
+    clear_stale_bytecode()
+    
+    if len(variants) == 1:
+        return build_simple_app(variants[0])
+    
+    # PyInstaller is mostly single-threaded, so run variants side by side
+    max_workers = min(os.cpu_count() or 1, len(variants))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_build_variant_in_worker, variants))
+    return all(results)
+
+def build_once():
+    """Run preflight and build, skipping PyInstaller when nothing changed"""
+    source_hash = run_preflight()
+    
+    # Skip PyInstaller entirely when nothing changed since the last build
+    build_key = compute_build_key(source_hash)
+    if is_build_up_to_date(build_key):
+        print("✅ Build is up-to-date - nothing to do")
+        return True
+    
+    if build_all_variants():
+        save_build_key(build_key)
+        return True
+    return False
+
+def _build_server_authkey(create=False):
+    """Key for the build server connection: SHREELOCK_BUILD_AUTHKEY or a private key file"""
+    env_key = os.environ.get("SHREELOCK_BUILD_AUTHKEY")
+    if env_key:
+        return env_key.encode("utf-8")
+    
+    try:
+        with open(BUILD_SERVER_KEY_FILE, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        if not create:
+            raise RuntimeError(
+                f"No build server key at {BUILD_SERVER_KEY_FILE} - start 'python build.py --server' first"
+            )
+    
+    # Only the build user may read it (0600); O_EXCL so a concurrent server can't clobber it
+    os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+    key = os.urandom(32)
+    fd = os.open(BUILD_SERVER_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+def run_build_server():
+    """Serve rebuild requests from a resident interpreter with PyInstaller already imported"""
+    import PyInstaller.__main__  # noqa: F401 - keep PyInstaller's module graph loaded
+    
+    host, port = BUILD_SERVER_ADDRESS
+    print(f"🖥️ Build server listening on {host}:{port} (Ctrl+C to stop)")
+    with Listener(BUILD_SERVER_ADDRESS, authkey=_build_server_authkey(create=True)) as listener:
+        while True:
+            # A stray or wrong-key connection must not take the resident server down
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, EOFError, OSError) as e:
+                print(f"⚠️ Rejected build connection: {e}")
+                continue
+            with conn:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError) as e:
+                    print(f"⚠️ Build client disconnected: {e}")
+                    continue
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    try:
+                        if request.get("target") != "main.py":
+                            print(f"❌ Unknown build target: {request.get('target')}")
+                            ok = False
+                        elif not check_vlc():
+                            print("❌ VLC not found")
+                            print_troubleshooting()
+                            ok = False
+                        else:
+                            ok = build_once()
+                    except Exception as e:
+                        print(f"❌ Build failed: {e}")
+                        ok = False
+                try:
+                    conn.send({"ok": ok, "output": output.getvalue()})
+                except OSError as e:
+                    print(f"⚠️ Build client disconnected before the reply: {e}")
+
+def request_build():
+    """Ask a running build server to rebuild and print its output"""
+    with Client(BUILD_SERVER_ADDRESS, authkey=_build_server_authkey()) as conn:
+        conn.send({"target": "main.py"})
+        reply = conn.recv()
+    print(reply["output"], end="")
+    return reply["ok"]
 
 def main():
     """Main build function"""
     print("🔨 Shreelock Video Player - Build Script")
     print("=" * 40)
-    print("Building recommended portable application...")
     
     try:
-        install_pyinstaller()
-        build_simple_app()
+        if "--server" in sys.argv:
+            install_pyinstaller()
+            run_build_server()
+            return
+        if "--client" in sys.argv:
+            if not request_build():
+                sys.exit(1)
+            return
+        
+        print("Building recommended portable application...")
+        if os.environ.get("BUILDER") == "nuitka":
+            build_nuitka()
+            return
+        
+        # Fail in milliseconds instead of after a full PyInstaller run
+        if not check_vlc():
+            print("❌ VLC not found")
+            print_troubleshooting()
+            sys.exit(2)
+        
+        build_once()
             
     except KeyboardInterrupt:
         print("\n❌ Build cancelled by user")
@@ -6,20 +6,39 @@ Supports MP4, MKV formats with volume control, subtitles, and seek functionality
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import vlc
 import os
 import threading
+import queue
 import time
+import re
+import functools
 from pathlib import Path
 import sys
-import shutil
-import tempfile
-import subprocess
-import urllib.request
-import urllib.error
 
+# vlc, subprocess, tempfile and the HTTP modules are imported where they are
+# used: python-vlc loads libvlc on import, and the rest only serve the
+# VLC installer path.
+_vlc = None
+
+def _get_vlc():
+    """Import python-vlc on first use (raises if libvlc can't be loaded)"""
+    global _vlc
+    if _vlc is None:
+        import vlc
+        _vlc = vlc
+    return _vlc
+
+# Release-group prefix some files put in front of subtitle track names
+_SUB_PREFIX_RE = re.compile(r'MoviesMod\.chat - ')
+# External subtitle file extensions and language suffixes we look for next to a video
+_SUB_EXTS = ('.srt', '.vtt', '.ass', '.ssa', '.sub')
+_SUB_SUFFIXES = ('', '.en', '.eng', '.english')
+# --auto-install-vlc: install VLC without asking (scripted / unattended setups)
+_AUTO_INSTALL_VLC = '--auto-install-vlc' in sys.argv[1:]
+
+@functools.lru_cache(maxsize=1)
 def create_play_icon():
-    """Create a play button icon file for shortcuts"""
+    """Create a play button icon file for shortcuts (resolved once per process)"""
     try:
         if getattr(sys, 'frozen', False):
             # Running as compiled executable
@@ -50,44 +69,243 @@ def create_play_icon():
         # Fallback to Windows built-in icon
         return "shell32.dll,137"
 
+@functools.lru_cache(maxsize=4096)
+def _format_seconds(seconds):
+    """MM:SS or HH:MM:SS for a whole number of seconds (cached - the same values repeat every tick)"""
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    seconds = seconds % 60
+    
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    else:
+        return f"{minutes:02d}:{seconds:02d}"
+
+# Shortcut base folders (APPDATA only exists on Windows)
+_HOME = os.path.expanduser("~")
+_APPDATA = os.environ.get("APPDATA", "")
+# Windows known-folder ids (these follow OneDrive / redirected profile folders)
+_FOLDERID_DESKTOP = "{B4BFCC3A-DB2C-424C-B029-7FE99A87C641}"
+_FOLDERID_PROGRAMS = "{A77F5D77-2E2B-44C3-A6A2-ABA601054A51}"
+
+def _known_folder_path(folder_id):
+    """Resolve a Windows known folder via SHGetKnownFolderPath (None elsewhere or on failure)"""
+    if os.name != 'nt':
+        return None
+    try:
+        import ctypes
+        import uuid
+        from ctypes import wintypes
+        
+        class GUID(ctypes.Structure):
+            _fields_ = [
+                ("Data1", wintypes.DWORD),
+                ("Data2", wintypes.WORD),
+                ("Data3", wintypes.WORD),
+                ("Data4", ctypes.c_ubyte * 8),
+            ]
+        
+        shell32 = ctypes.windll.shell32
+        shell32.SHGetKnownFolderPath.argtypes = [
+            ctypes.POINTER(GUID), wintypes.DWORD, wintypes.HANDLE, ctypes.POINTER(ctypes.c_void_p)
+        ]
+        shell32.SHGetKnownFolderPath.restype = ctypes.c_long  # HRESULT
+        co_task_mem_free = ctypes.windll.ole32.CoTaskMemFree
+        co_task_mem_free.argtypes = [ctypes.c_void_p]
+        co_task_mem_free.restype = None
+        
+        guid = GUID.from_buffer_copy(uuid.UUID(folder_id).bytes_le)
+        path_ptr = ctypes.c_void_p()
+        try:
+            if shell32.SHGetKnownFolderPath(ctypes.byref(guid), 0, None, ctypes.byref(path_ptr)) != 0:
+                return None
+            return ctypes.wstring_at(path_ptr.value)
+        finally:
+            # The buffer must be freed even when the call fails (freeing NULL is a no-op)
+            co_task_mem_free(path_ptr)
+    except Exception as e:
+        print(f"⚠️ Could not resolve known folder {folder_id}: {e}")
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _desktop_dir():
+    """Desktop folder for shortcuts (SHREELOCK_SHORTCUT_DIR/Desktop when overridden)"""
+    override = os.environ.get("SHREELOCK_SHORTCUT_DIR")
+    return (
+        (override and os.path.join(override, "Desktop"))
+        or _known_folder_path(_FOLDERID_DESKTOP)
+        or os.path.join(os.environ.get("USERPROFILE") or _HOME, "Desktop")
+    )
+
+@functools.lru_cache(maxsize=1)
+def _start_menu_programs_dir():
+    """Start Menu Programs folder for shortcuts (SHREELOCK_SHORTCUT_DIR/Start Menu when overridden)"""
+    override = os.environ.get("SHREELOCK_SHORTCUT_DIR")
+    return (
+        (override and os.path.join(override, "Start Menu"))
+        or _known_folder_path(_FOLDERID_PROGRAMS)
+        or os.path.join(_APPDATA, "Microsoft", "Windows", "Start Menu", "Programs")
+    )
+
+# Common VLC installation paths (deduplicated - the env vars usually match the defaults)
+_VLC_PATHS = sorted({
+    "C:\\Program Files\\VideoLAN\\VLC\\vlc.exe",
+    "C:\\Program Files (x86)\\VideoLAN\\VLC\\vlc.exe",
+    os.path.join(os.environ.get('PROGRAMFILES', ''), 'VideoLAN', 'VLC', 'vlc.exe'),
+    os.path.join(os.environ.get('PROGRAMFILES(X86)', ''), 'VideoLAN', 'VLC', 'vlc.exe')
+})
+_VLC_CHECKED = False  # Set once VLC has been found
+
 def check_vlc_installation():
     """Check if VLC is installed on the system"""
+    global _VLC_CHECKED
+    if _VLC_CHECKED:
+        return True
+    
+    # No vlc.Instance() probe here - the player creates the real instance right
+    # after this check, so a test instance would load libvlc twice on startup
+    for path in _VLC_PATHS:
+        if os.path.exists(path):
+            _VLC_CHECKED = True
+            return True
+    
+    # Otherwise see whether python-vlc can load libvlc (e.g. non-default install or Linux)
     try:
-        # Try to create a VLC instance to test if it's working
-        test_instance = vlc.Instance('--quiet')
-        if test_instance:
+        if getattr(_get_vlc(), 'dll', None) is not None:
+            _VLC_CHECKED = True
             return True
     except Exception:
         pass
     
-    # Check common VLC installation paths
-    vlc_paths = [
-        "C:\\Program Files\\VideoLAN\\VLC\\vlc.exe",
-        "C:\\Program Files (x86)\\VideoLAN\\VLC\\vlc.exe",
-        os.path.join(os.environ.get('PROGRAMFILES', ''), 'VideoLAN', 'VLC', 'vlc.exe'),
-        os.path.join(os.environ.get('PROGRAMFILES(X86)', ''), 'VideoLAN', 'VLC', 'vlc.exe')
-    ]
+    return False
+
+_VLC_INSTANCE = None  # Shared libvlc instance (see get_vlc_instance)
+_VLC_INSTANCE_ARGS = ('--quiet', '--no-video-title-show', '--no-stats')
+_VLC_INSTALL_DIR = None  # Cached result of find_vlc_install_dir
+
+def get_vlc_instance():
+    """Return the process-wide VLC instance, creating it on first use"""
+    global _VLC_INSTANCE
+    if _VLC_INSTANCE is None:
+        _VLC_INSTANCE = _get_vlc().Instance(*_VLC_INSTANCE_ARGS)
+    return _VLC_INSTANCE
+
+def find_vlc_install_dir():
+    """Return the VLC installation directory, or None if not found"""
+    global _VLC_INSTALL_DIR
+    if _VLC_INSTALL_DIR is None:
+        for path in _VLC_PATHS:
+            if os.path.exists(path):
+                _VLC_INSTALL_DIR = os.path.dirname(path)
+                break
+    return _VLC_INSTALL_DIR
+
+def ensure_vlc_plugin_cache():
+    """Generate VLC's plugins.dat if missing (without it first launch takes ~15s)"""
+    vlc_dir = find_vlc_install_dir()
+    if not vlc_dir:
+        return
     
-    for path in vlc_paths:
-        if os.path.exists(path):
-            return True
+    plugins_dir = os.path.join(vlc_dir, "plugins")
+    cache_gen = os.path.join(vlc_dir, "vlc-cache-gen.exe")
+    if os.path.exists(os.path.join(plugins_dir, "plugins.dat")) or not os.path.exists(cache_gen):
+        return
     
-    return False
+    try:
+        import subprocess
+        subprocess.run([cache_gen, plugins_dir], capture_output=True, timeout=120)
+    except Exception as e:
+        print(f"Failed to generate VLC plugin cache: {e}")
+
+_HTTP_CONNECTIONS = {}  # (scheme, host) -> keep-alive connection shared by all downloads
+
+def _get_http_connection(scheme, host):
+    """Return the pooled connection for a host, creating it on first use"""
+    import http.client
+    key = (scheme, host)
+    conn = _HTTP_CONNECTIONS.get(key)
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conn_class(host, timeout=60)
+        _HTTP_CONNECTIONS[key] = conn
+    return conn
+
+def _open_url(url, max_redirects=5):
+    """GET a URL over a pooled keep-alive connection, following redirects"""
+    import http.client
+    import urllib.parse
+    import urllib.error
+    
+    for _ in range(max_redirects + 1):
+        parts = urllib.parse.urlsplit(url)
+        conn = _get_http_connection(parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        
+        try:
+            conn.request("GET", path, headers={"User-Agent": "ShreelockVideoPlayer"})
+            response = conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # Server dropped the kept-alive connection - reconnect once
+            conn.close()
+            conn.request("GET", path, headers={"User-Agent": "ShreelockVideoPlayer"})
+            response = conn.getresponse()
+        
+        if response.status in (301, 302, 303, 307, 308):
+            location = response.getheader("Location")
+            response.read()  # Drain so the connection can be reused
+            url = urllib.parse.urljoin(url, location)
+            continue
+        
+        if response.status != 200:
+            response.read()
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        
+        return response
+    
+    raise urllib.error.URLError(f"Too many redirects: {url}")
 
 def download_vlc_installer(progress_callback=None):
     """Download VLC installer from official website"""
+    import tempfile
+    
     try:
         # VLC download URL (64-bit Windows installer)
         vlc_url = "https://download.videolan.org/pub/videolan/vlc/last/win64/vlc-3.0.20-win64.exe"
         temp_dir = tempfile.gettempdir()
         installer_path = os.path.join(temp_dir, "vlc_installer.exe")
         
-        def download_progress_hook(block_num, block_size, total_size):
-            if progress_callback and total_size > 0:
-                progress = min((block_num * block_size) / total_size * 100, 100)
-                progress_callback(progress)
+        response = _open_url(vlc_url)
+        total_size = int(response.getheader("Content-Length") or 0)
+        downloaded = 0
+        last_reported = 0
+        
+        # Stream to disk through one reusable 1 MiB buffer. O_SEQUENTIAL (Windows only)
+        # tells the cache manager this is a one-pass write; O_BINARY keeps the CRT
+        # from translating newlines since we open the descriptor ourselves.
+        buffer = bytearray(1 << 20)
+        view = memoryview(buffer)
+        fd = os.open(
+            installer_path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0),
+        )
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+            while True:
+                size = response.readinto(buffer)
+                if not size:
+                    break
+                f.write(view[:size])
+                downloaded += size
+                
+                # Report progress every 256 KiB rather than on every read
+                if progress_callback and total_size > 0 and (
+                    downloaded - last_reported >= 262144 or downloaded >= total_size
+                ):
+                    last_reported = downloaded
+                    progress_callback(min(downloaded / total_size * 100, 100))
         
-        urllib.request.urlretrieve(vlc_url, installer_path, download_progress_hook)
         return installer_path
         
     except Exception as e:
@@ -95,16 +313,29 @@ def download_vlc_installer(progress_callback=None):
         return None
 
 def install_vlc_silently(installer_path):
-    """Install VLC silently in the background"""
+    """Install VLC silently in the background (blocks - call from a worker thread)"""
+    import subprocess
+    
     try:
-        # Run VLC installer with silent parameters
-        result = subprocess.run([
+        # Run VLC installer with silent parameters (no pipes, so nothing can fill up)
+        process = subprocess.Popen([
             installer_path, 
             '/S',  # Silent installation
             '/NCRC'  # Skip CRC check
-        ], capture_output=True, text=True, timeout=300)
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        try:
+            process.wait(timeout=300)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            return False
+        
+        if process.returncode != 0:
+            return False
         
-        return result.returncode == 0
+        ensure_vlc_plugin_cache()
+        return True
         
     except Exception as e:
         print(f"Failed to install VLC: {e}")
@@ -115,24 +346,15 @@ def auto_install_vlc_if_needed():
     if check_vlc_installation():
         return True
     
-    # Show installation dialog
-    result = messagebox.askyesno(
+    # Single combined dialog (skipped with --auto-install-vlc)
+    if not _AUTO_INSTALL_VLC and not messagebox.askyesno(
         "VLC Engine Required",
         "Shreelock Video Player needs VLC Media Player to function.\n\n"
         "Would you like to automatically download and install VLC?\n"
         "(This will download ~40MB from the official VLC website)\n\n"
-        "Click 'Yes' for automatic installation\n"
-        "Click 'No' for manual installation instructions"
-    )
-    
-    if not result:
-        # Show manual installation instructions
-        messagebox.showinfo(
-            "Manual Installation",
-            "Please download and install VLC Media Player from:\n"
-            "https://videolan.org/vlc/\n\n"
-            "After installation, restart Shreelock Video Player."
-        )
+        "Click 'No' to install it yourself from https://videolan.org/vlc/\n"
+        "and restart Shreelock Video Player afterwards."
+    ):
         return False
     
     # Create progress window
@@ -141,6 +363,8 @@ def auto_install_vlc_if_needed():
     progress_window.geometry("400x150")
     progress_window.resizable(False, False)
     progress_window.configure(bg='black')
+    # Closing mid-install would strand wait_variable below; the window closes itself when done
+    progress_window.protocol("WM_DELETE_WINDOW", lambda: None)
     
     # Center the window
     progress_window.transient()
@@ -164,41 +388,83 @@ def auto_install_vlc_if_needed():
     )
     progress_bar.pack(pady=10)
     
-    def update_progress(progress):
-        progress_var.set(progress)
-        progress_window.update()
+    # Download and install on a worker thread; it reports (status_text, progress)
+    # tuples through the queue and only the Tk thread touches the widgets
+    progress_queue = queue.Queue()
+    install_done = tk.BooleanVar(progress_window, value=False)
+    outcome = {}
+    
+    def do_install():
+        try:
+            progress_queue.put(("Downloading VLC installer...", 0))
+            installer_path = download_vlc_installer(
+                lambda progress: progress_queue.put(("Downloading VLC installer...", progress))
+            )
+            if not installer_path:
+                raise Exception("Download failed")
+            
+            # The installer reports no progress (None = indeterminate bar)
+            progress_queue.put(("Installing VLC Media Player...", None))
+            outcome['installer_path'] = installer_path
+            outcome['installed'] = install_vlc_silently(installer_path)
+        except Exception as e:
+            outcome['error'] = e
+        finally:
+            progress_queue.put(None)  # Worker finished
+    
+    def drain_queue():
+        try:
+            while True:
+                item = progress_queue.get_nowait()
+                if item is None:
+                    install_done.set(True)
+                    return
+                
+                status_text, progress = item
+                status_label.config(text=status_text)
+                if progress is None:
+                    progress_bar.configure(mode='indeterminate')
+                    progress_bar.start(10)
+                else:
+                    progress_var.set(progress)
+        except queue.Empty:
+            pass
+        progress_window.after(50, drain_queue)
+    
+    threading.Thread(target=do_install, daemon=True).start()
+    progress_window.after(50, drain_queue)
+    progress_window.wait_variable(install_done)  # Event loop keeps running meanwhile
+    
+    progress_bar.stop()
+    progress_bar.configure(mode='determinate')
+    progress_var.set(100)
     
     try:
-        # Download VLC installer
-        status_label.config(text="Downloading VLC installer...")
-        progress_window.update()
+        if 'error' in outcome:
+            raise outcome['error']
+        installer_path = outcome['installer_path']
         
-        installer_path = download_vlc_installer(update_progress)
-        if not installer_path:
-            raise Exception("Download failed")
-        
-        # Install VLC
-        status_label.config(text="Installing VLC Media Player...")
-        progress_var.set(100)
-        progress_window.update()
-        
-        if install_vlc_silently(installer_path):
+        if outcome['installed']:
             status_label.config(text="Installation completed successfully!")
-            progress_window.update()
-            time.sleep(2)
-            progress_window.destroy()
             
             # Clean up installer
             try:
                 os.remove(installer_path)
             except:
                 pass
-                
-            messagebox.showinfo(
-                "Success", 
-                "VLC Media Player has been installed successfully!\n"
-                "Shreelock Video Player is ready to use."
-            )
+            
+            # Leave the success message up for 2 seconds without blocking mainloop
+            def show_done():
+                progress_window.destroy()
+                if _AUTO_INSTALL_VLC:
+                    return
+                messagebox.showinfo(
+                    "Success", 
+                    "VLC Media Player has been installed successfully!\n"
+                    "Shreelock Video Player is ready to use."
+                )
+            
+            progress_window.after(2000, show_done)
             return True
         else:
             raise Exception("Installation failed")
@@ -214,6 +480,14 @@ def auto_install_vlc_if_needed():
         return False
 
 class ShreelockVideoPlayer:
+    # Play button labels, switched through a StringVar instead of configure()
+    _PLAY_TEXT = "▶️ Play"
+    _PAUSE_TEXT = "⏸️ Pause"
+    # Background player.stop() started by on_closing (None until then)
+    _stop_thread = None
+    # Shortcut file name; the folders are resolved lazily (see desktop_shortcut)
+    SHORTCUT_NAME = "Shreelock Video Player.lnk"
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Shreelock Video Player")
@@ -223,17 +497,25 @@ class ShreelockVideoPlayer:
         # VLC instance and player - with auto-installation
         try:
             # Check if VLC is available, install if needed
+            # The user has already been told how to install VLC manually
             if not auto_install_vlc_if_needed():
-                messagebox.showerror(
-                    "VLC Required", 
-                    "VLC Media Player is required but not available.\n"
-                    "Please install VLC manually and restart the application."
-                )
                 self.root.destroy()
                 return
             
-            self.vlc_instance = vlc.Instance('--quiet')
+            self.vlc_instance = get_vlc_instance()
+            if self.vlc_instance is None:
+                raise Exception("Failed to create VLC instance")
             self.player = self.vlc_instance.media_player_new()
+            # libvlc callbacks and worker threads never touch Tk: they queue (function, args)
+            # work items here and update_position drains them on the Tk thread
+            self._ui_calls = queue.Queue()
+            # Subtitle tracks become visible once VLC adds their elementary streams
+            self._subs_refresh_pending = False
+            self._subs_loaded_file = None  # File whose tracks were found and auto-selected
+            self._spu_count_seen = -1  # VLC subtitle count already reflected in the combo
+            self.player.event_manager().event_attach(
+                _get_vlc().EventType.MediaPlayerESAdded, self._on_es_added
+            )
             
         except Exception as e:
             messagebox.showerror(
@@ -247,21 +529,41 @@ class ShreelockVideoPlayer:
         # Player state variables
         self.is_playing = False
         self.current_file = None
+        self._file_path = None  # Path(current_file) and its parent/stem, computed once per load
+        self._file_dir = None
+        self._file_stem = None
         self.volume = 50
         self.duration = 0
+        self._duration_str = "00:00"  # format_time(self.duration), computed when the duration changes
+        self._duration_pct_scale = 0.0  # 100 / self.duration, for the per-tick progress percentage
         self.position = 0
+        self._last_cur_str = "00:00"  # Last text/value pushed by update_position
+        self._last_pos_pct = 0.0
+        self._media = None  # Current vlc.Media and its event manager (kept alive for callbacks)
+        self._media_events = None
         self.subtitle_tracks = []
         self.current_subtitle = -1
+        self._sub_cache = {}  # file -> (VLC subtitle count, track names, label -> VLC id)
+        self._sub_label_to_vlc_id = {"None": -1}  # Combobox label -> VLC spu id (embedded tracks)
         self.is_fullscreen = False
         self.seeking_direction = None  # For continuous seeking
         self.seek_timer = None
+        self._seek_last = 0.0  # time.monotonic() of the last continuous-seek step
+        self._seek_base_time = 0  # Player time when the key went down
+        self._seek_accum = 0  # Offset (ms) seeked since then
+        self.volume_timer = None  # Held up/down arrow volume repeat
         
         # Fullscreen state management
         self.cursor_hide_timer = None
         self.mouse_moved = False
+        self._cursor_visible = True  # Whether the cursor is currently shown (fullscreen auto-hide)
+        self._last_mouse_move = 0.0  # time.monotonic() of the last handled <Motion> event
         self.controls_visible = True
         self.menu_visible = True
-        self.osd_widgets = {}  # Store OSD pop-up widgets
+        self._screen_size = None  # (width, height), cached until the root window is reconfigured
+        self._root_geom = None  # Root (x, y, width, height) on screen, same invalidation
+        self._window_mapped = True  # False while the root window is minimized (<Unmap>)
+        self._osd_pool = {}  # OSD type -> (Toplevel, icon label, message label), reused across shows
         self.osd_timers = {}   # Store OSD hide timers
         
         # Progress bar overlay for seeking in fullscreen
@@ -273,10 +575,8 @@ class ShreelockVideoPlayer:
         self.create_widgets()
         self.setup_bindings()
         
-        # Start position update thread
-        self.update_thread_running = True
-        self.update_thread = threading.Thread(target=self.update_position, daemon=True)
-        self.update_thread.start()
+        # Start position updates on the Tk event loop
+        self._pos_after = self.root.after(250, self.update_position)
     
     def create_menu_bar(self):
         """Create the professional menu bar"""
@@ -375,9 +675,10 @@ class ShreelockVideoPlayer:
         )
         self.backward_button.pack(side=tk.LEFT, padx=2)
         
+        self._play_label_var = tk.StringVar(value=self._PLAY_TEXT)
         self.play_button = tk.Button(
             playback_frame, 
-            text="▶️ Play", 
+            textvariable=self._play_label_var, 
             command=self.toggle_play_pause,
             bg='#1a1a1a',
             fg='white',
@@ -453,7 +754,7 @@ class ShreelockVideoPlayer:
         self.reload_subs_button = tk.Button(
             subtitle_frame,
             text="🔄",
-            command=self.load_subtitle_tracks,
+            command=lambda: self.load_subtitle_tracks(use_cache=False),
             bg='#404040',
             fg='white',
             font=('Arial', 8),
@@ -468,10 +769,10 @@ class ShreelockVideoPlayer:
         self.root.bind('<space>', lambda e: self.toggle_play_pause())
         
         # Enhanced seeking with key press and release
-        self.root.bind('<KeyPress-Left>', self.on_left_key_press)
-        self.root.bind('<KeyRelease-Left>', self.on_left_key_release)
-        self.root.bind('<KeyPress-Right>', self.on_right_key_press)
-        self.root.bind('<KeyRelease-Right>', self.on_right_key_release)
+        self.root.bind('<KeyPress-Left>', lambda e: self.on_seek_key_press("backward"))
+        self.root.bind('<KeyPress-Right>', lambda e: self.on_seek_key_press("forward"))
+        self.root.bind('<KeyRelease-Left>', lambda e: self.stop_continuous_seek())
+        self.root.bind('<KeyRelease-Right>', lambda e: self.stop_continuous_seek())
         
         # Volume control
         self.root.bind('<KeyPress-Up>', self.on_up_key_press)
@@ -486,6 +787,11 @@ class ShreelockVideoPlayer:
         self.root.bind('<Escape>', lambda e: self.exit_fullscreen())  # Escape to exit fullscreen
         self.root.bind('<c>', lambda e: self.clear_video())  # 'c' key to clear video
         
+        # Window geometry changes (fullscreen toggles, moves to another monitor)
+        self.root.bind('<Configure>', self.on_root_configure)
+        self.root.bind('<Map>', self.on_root_map)
+        self.root.bind('<Unmap>', self.on_root_map)
+        
         # Mouse motion tracking for fullscreen
         self.root.bind('<Motion>', self.on_mouse_move)
         self.video_frame.bind('<Motion>', self.on_mouse_move)
@@ -517,8 +823,12 @@ class ShreelockVideoPlayer:
             
             # Create media object
             self.current_file = filename
+            self._file_path = Path(filename)
+            self._file_dir = self._file_path.parent
+            self._file_stem = self._file_path.stem
             media = self.vlc_instance.media_new(filename)
             self.player.set_media(media)
+            self._media = media
             
             # Set video output to our frame (Windows specific)
             if os.name == 'nt':  # Windows
@@ -527,24 +837,64 @@ class ShreelockVideoPlayer:
                 self.player.set_xwindow(self.video_frame.winfo_id())
             
             # Update UI
-            file_name = Path(filename).name
+            file_name = self._file_path.name
             self.info_label.configure(text=f"Loaded: {file_name}")
             self.root.title(f"My VLC Player - {file_name}")
             
-            # Parse media to get duration and subtitle tracks
-            media.parse()
-            self.duration = media.get_duration()
+            # Parse media in the background; the duration arrives via MediaParsedChanged
+            vlc = _get_vlc()
+            self._set_duration(0)
+            self._media_events = media.event_manager()
+            self._media_events.event_attach(vlc.EventType.MediaParsedChanged, self._on_media_parsed, media)
+            media.parse_with_options(vlc.MediaParseFlag.local, 0)
             
             # Reset subtitle UI first
             self.subtitle_tracks = ["None"]
             self.subtitle_combo['values'] = self.subtitle_tracks
             self.subtitle_combo.set("None")
+            self._subs_loaded_file = None
+            self._spu_count_seen = -1
             
             print(f"Loaded video: {filename}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Could not load video file:\n{str(e)}")
     
+    def _drain_ui_calls(self):
+        """Run work queued by libvlc callbacks / worker threads (called from update_position)"""
+        while True:
+            try:
+                func, *args = self._ui_calls.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                func(*args)
+            except Exception as e:
+                # One failing item must not drop the rest of the queue
+                print(f"❌ Error running queued UI call {getattr(func, '__name__', func)}: {e}")
+                import traceback
+                traceback.print_exc()
+    
+    def _on_media_parsed(self, event, media):
+        """VLC callback (libvlc thread) - hand the parsed media over to the Tk thread"""
+        self._ui_calls.put((self._apply_parsed_media, media))
+    
+    def _apply_parsed_media(self, media):
+        """Pick up the duration once VLC has parsed the media"""
+        if media is not self._media:
+            return  # Another file was loaded meanwhile
+        
+        self._set_duration(max(media.get_duration(), 0))
+    
+    def _set_duration(self, milliseconds):
+        """Store the media duration and refresh the total-time label if its text changes"""
+        self.duration = milliseconds
+        self._duration_pct_scale = 100.0 / max(milliseconds, 1)
+        duration_str = self.format_time(milliseconds)
+        if duration_str != self._duration_str:
+            self._duration_str = duration_str
+            self.total_time_label.configure(text=duration_str)
+    
     def toggle_play_pause(self):
         """Toggle between play and pause"""
         if not self.current_file:
@@ -553,29 +903,30 @@ class ShreelockVideoPlayer:
         
         if self.is_playing:
             self.player.pause()
-            self.play_button.configure(text="▶️ Play")
+            self._play_label_var.set(self._PLAY_TEXT)
             self.is_playing = False
         else:
             self.player.play()
-            self.play_button.configure(text="⏸️ Pause")
+            self._play_label_var.set(self._PAUSE_TEXT)
             self.is_playing = True
-            
-            # Load subtitles after starting playback - this is when VLC can detect them properly
-            self.root.after(2000, self.load_subtitle_tracks)  # Wait 2 seconds for media to initialize
     
     def stop_playback(self):
         """Stop video playback"""
         self.player.stop()
         self.is_playing = False
-        self.play_button.configure(text="▶️ Play")
+        self._play_label_var.set(self._PLAY_TEXT)
         self.progress_var.set(0)
         self.current_time_label.configure(text="00:00")
+        self._last_cur_str = "00:00"
+        self._last_pos_pct = 0.0
         
         # Reset subtitle selection
         self.subtitle_tracks = ["None"]
         self.subtitle_combo['values'] = self.subtitle_tracks
         self.subtitle_combo.set("None")
         self.current_subtitle = -1
+        self._subs_loaded_file = None
+        self._spu_count_seen = -1
     
     def seek_forward(self):
         """Seek forward by 10 seconds"""
@@ -587,7 +938,7 @@ class ShreelockVideoPlayer:
             # Show appropriate feedback based on mode
             if self.is_fullscreen:
                 self.show_osd("seek", "", "⏩")
-                self.show_progress_overlay()  # Show progress bar in fullscreen
+                self.show_progress_overlay(new_time)  # Show progress bar in fullscreen
     
     def seek_backward(self):
         """Seek backward by 10 seconds"""
@@ -599,7 +950,7 @@ class ShreelockVideoPlayer:
             # Show appropriate feedback based on mode
             if self.is_fullscreen:
                 self.show_osd("seek", "", "⏪")
-                self.show_progress_overlay()  # Show progress bar in fullscreen
+                self.show_progress_overlay(new_time)  # Show progress bar in fullscreen
     
     def on_volume_change(self, value):
         """Handle volume slider changes"""
@@ -631,67 +982,59 @@ class ShreelockVideoPlayer:
             new_time = int(position * self.duration)
             self.player.set_time(new_time)
     
-    def load_subtitle_tracks(self):
+    def _on_es_added(self, event):
+        """VLC callback (libvlc thread) - schedule one subtitle refresh per burst of new streams"""
+        if not self._subs_refresh_pending:
+            self._subs_refresh_pending = True
+            self._ui_calls.put((self._refresh_subs,))
+    
+    def _refresh_subs(self):
+        """Reload subtitle tracks now that VLC has exposed the media's streams"""
+        self._subs_refresh_pending = False
+        if not self.current_file:
+            return
+        
+        # Audio/video streams, or the stream of an external file we attached ourselves,
+        # leave the subtitle count where the combo already has it
+        if self.player.video_get_spu_count() == self._spu_count_seen:
+            return
+        
+        # Only the first load of a file resets the combo and auto-selects a track;
+        # later refreshes just extend the list and keep the user's choice
+        self.load_subtitle_tracks(keep_selection=self._subs_loaded_file == self.current_file)
+    
+    def load_subtitle_tracks(self, use_cache=True, keep_selection=False):
         """Load available subtitle tracks - fixed detection method"""
         try:
             print("🔍 Searching for subtitle tracks...")
             
-            # Wait a moment for VLC to fully initialize
-            time.sleep(1)
-            
             # Get subtitle track count
             subtitle_count = self.player.video_get_spu_count()
+            self._spu_count_seen = subtitle_count
             print(f"VLC reports {subtitle_count} subtitle tracks")
             
-            # Initialize with None option
-            self.subtitle_tracks = ["None"]
-            
-            if subtitle_count > 0:
-                try:
-                    # Get subtitle track descriptions
-                    subtitle_descriptions = self.player.video_get_spu_description()
-                    print(f"Subtitle descriptions: {subtitle_descriptions}")
-                    
-                    if subtitle_descriptions:
-                        for i, (track_id, description) in enumerate(subtitle_descriptions):
-                            # Skip the "Disable" option (ID = -1)
-                            if track_id == -1:
-                                continue
-                                
-                            if description:
-                                # Handle both string and bytes
-                                if isinstance(description, bytes):
-                                    description = description.decode('utf-8', errors='ignore')
-                                
-                                # Clean up the description
-                                desc_clean = description.replace('MoviesMod.chat - ', '').strip('[]')
-                                track_name = f"Track {len(self.subtitle_tracks)}: {desc_clean}"
-                            else:
-                                track_name = f"Track {len(self.subtitle_tracks)}"
-                            
-                            self.subtitle_tracks.append(track_name)
-                            print(f"Added subtitle track: {track_name} (VLC ID: {track_id})")
-                    
-                except Exception as e:
-                    print(f"Error getting subtitle descriptions: {e}")
-                    # Fallback: Add numbered tracks based on count
-                    for i in range(1, subtitle_count):  # Skip first one if it's "Disable"
-                        track_name = f"Track {i}"
-                        self.subtitle_tracks.append(track_name)
-                        print(f"Added fallback track: {track_name}")
-            
-            # Method 2: Also check for external subtitle files
-            if self.current_file:
-                self.detect_external_subtitles()
+            # Reuse the track list from the last load of this file if VLC agrees on the count
+            cached = self._sub_cache.get(self.current_file) if use_cache else None
+            if cached and cached[0] == subtitle_count:
+                self.subtitle_tracks = list(cached[1])
+                self._sub_label_to_vlc_id = dict(cached[2])
+            else:
+                self._scan_subtitle_tracks(subtitle_count)
+                self._sub_cache[self.current_file] = (
+                    subtitle_count, list(self.subtitle_tracks), dict(self._sub_label_to_vlc_id)
+                )
             
             # Update the UI
             self.subtitle_combo['values'] = self.subtitle_tracks
+            if keep_selection:
+                return
             self.subtitle_combo.set("None")
             self.current_subtitle = -1
             
             total_tracks = len(self.subtitle_tracks) - 1  # -1 for "None"
             if total_tracks > 0:
                 print(f"✅ Found {total_tracks} subtitle tracks total")
+                self._subs_loaded_file = self.current_file
                 
                 # Auto-select first subtitle track if available
                 if len(self.subtitle_tracks) > 1:
@@ -709,38 +1052,82 @@ class ShreelockVideoPlayer:
             self.subtitle_combo['values'] = self.subtitle_tracks
             self.subtitle_combo.set("None")
     
+    def _scan_subtitle_tracks(self, subtitle_count):
+        """Build self.subtitle_tracks from VLC's track descriptions and external files"""
+        # Initialize with None option
+        self.subtitle_tracks = ["None"]
+        self._sub_label_to_vlc_id = {"None": -1}
+        
+        if subtitle_count > 0:
+            try:
+                # Get subtitle track descriptions
+                subtitle_descriptions = self.player.video_get_spu_description()
+                print(f"Subtitle descriptions: {subtitle_descriptions}")
+                
+                if subtitle_descriptions:
+                    for i, (track_id, description) in enumerate(subtitle_descriptions):
+                        # Skip the "Disable" option (ID = -1)
+                        if track_id == -1:
+                            continue
+                            
+                        if description:
+                            # Handle both string and bytes
+                            if isinstance(description, bytes):
+                                description = description.decode('utf-8', errors='ignore')
+                            
+                            # Clean up the description
+                            desc_clean = _SUB_PREFIX_RE.sub('', description).strip('[]')
+                            track_name = f"Track {len(self.subtitle_tracks)}: {desc_clean}"
+                        else:
+                            track_name = f"Track {len(self.subtitle_tracks)}"
+                        
+                        self.subtitle_tracks.append(track_name)
+                        self._sub_label_to_vlc_id[track_name] = track_id
+                        print(f"Added subtitle track: {track_name} (VLC ID: {track_id})")
+                
+            except Exception as e:
+                print(f"Error getting subtitle descriptions: {e}")
+                # Fallback: Add numbered tracks based on count
+                for i in range(1, subtitle_count):  # Skip first one if it's "Disable"
+                    track_name = f"Track {i}"
+                    self.subtitle_tracks.append(track_name)
+                    self._sub_label_to_vlc_id[track_name] = i - 1  # Best guess: 0-based index
+                    print(f"Added fallback track: {track_name}")
+        
+        # Method 2: Also check for external subtitle files
+        if self.current_file:
+            self.detect_external_subtitles()
+    
     def detect_external_subtitles(self):
         """Detect external subtitle files in the same directory"""
         try:
             if not self.current_file:
                 return
-                
-            import os
-            from pathlib import Path
             
-            video_path = Path(self.current_file)
-            video_dir = video_path.parent
-            video_name = video_path.stem
+            video_dir = self._file_dir
+            video_name = self._file_stem
             
-            # Common subtitle extensions
-            subtitle_extensions = ['.srt', '.vtt', '.ass', '.ssa', '.sub']
+            # One directory listing instead of a stat per candidate name, keeping
+            # only subtitle files (keyed by lowercase name, like Windows path lookups)
+            with os.scandir(video_dir) as entries:
+                dir_subs = {}
+                for entry in entries:
+                    name_lower = entry.name.lower()
+                    if name_lower.endswith(_SUB_EXTS):
+                        dir_subs[name_lower] = entry.name
             
             external_subs = []
-            for ext in subtitle_extensions:
-                # Check for subtitle files with same name
-                sub_file = video_dir / f"{video_name}{ext}"
-                if sub_file.exists():
-                    external_subs.append(str(sub_file))
-                    
-                # Also check for common subtitle naming patterns
-                for suffix in ['', '.en', '.eng', '.english']:
-                    sub_file = video_dir / f"{video_name}{suffix}{ext}"
-                    if sub_file.exists() and str(sub_file) not in external_subs:
-                        external_subs.append(str(sub_file))
+            if dir_subs:
+                video_name_lower = video_name.lower()
+                for ext in _SUB_EXTS:
+                    # Same name, plus common language-suffixed naming patterns
+                    for suffix in _SUB_SUFFIXES:
+                        sub_name = dir_subs.get(f"{video_name_lower}{suffix}{ext}")
+                        if sub_name and sub_name not in external_subs:
+                            external_subs.append(sub_name)
             
             # Add external subtitles to the list
-            for i, sub_file in enumerate(external_subs):
-                sub_name = Path(sub_file).name
+            for sub_name in external_subs:
                 track_name = f"External: {sub_name}"
                 if track_name not in self.subtitle_tracks:
                     self.subtitle_tracks.append(track_name)
@@ -755,60 +1142,36 @@ class ShreelockVideoPlayer:
             selected = self.subtitle_combo.get()
             print(f"🎯 Selected subtitle: {selected}")
             
-            if selected == "None":
-                # Disable subtitles
-                self.player.video_set_spu(-1)
-                self.current_subtitle = -1
-                print("❌ Subtitles disabled")
-                
-            elif selected.startswith("External:"):
+            if selected.startswith("External:"):
                 # Handle external subtitle files
                 sub_filename = selected.replace("External: ", "")
                 
                 if self.current_file:
-                    from pathlib import Path
-                    video_dir = Path(self.current_file).parent
-                    sub_path = video_dir / sub_filename
+                    sub_path = self._file_dir / sub_filename
                     
                     if sub_path.exists():
                         try:
                             self.player.video_set_subtitle_file(str(sub_path))
+                            # VLC adds a stream for the file; it's already listed as "External:"
+                            self._spu_count_seen += 1
                             print(f"✅ Loaded external subtitle: {sub_filename}")
                         except Exception as e:
                             print(f"❌ Error loading external subtitle: {e}")
                             messagebox.showerror("Subtitle Error", f"Could not load subtitle file:\n{sub_filename}")
-                
+                return
+            
+            # "None" (-1) and embedded tracks: VLC ids recorded when the tracks were scanned
+            vlc_id = self._sub_label_to_vlc_id.get(selected)
+            if vlc_id is None:
+                print(f"❌ Unknown subtitle track: {selected}")
+                return
+            
+            self.player.video_set_spu(vlc_id)
+            self.current_subtitle = vlc_id
+            if vlc_id == -1:
+                print("❌ Subtitles disabled")
             else:
-                # Handle embedded subtitle tracks
-                try:
-                    # Get the track index from our list (subtract 1 for "None")
-                    track_list_index = self.subtitle_tracks.index(selected)
-                    
-                    if track_list_index > 0:  # Skip "None" at index 0
-                        # Get the actual VLC track descriptions to find the right ID
-                        subtitle_descriptions = self.player.video_get_spu_description()
-                        
-                        if subtitle_descriptions:
-                            # Find the corresponding VLC track (skip "Disable" entry)
-                            vlc_track_index = 0
-                            for vlc_id, description in subtitle_descriptions:
-                                if vlc_id != -1:  # Skip "Disable"
-                                    vlc_track_index += 1
-                                    if vlc_track_index == track_list_index:
-                                        # Found the matching track
-                                        self.player.video_set_spu(vlc_id)
-                                        self.current_subtitle = vlc_id
-                                        print(f"✅ Enabled subtitle track ID {vlc_id}: {selected}")
-                                        return
-                        
-                        # Fallback: try using the track index directly
-                        fallback_index = track_list_index - 1  # Convert to 0-based for VLC
-                        self.player.video_set_spu(fallback_index)
-                        self.current_subtitle = fallback_index
-                        print(f"✅ Enabled subtitle track (fallback) index {fallback_index}: {selected}")
-                    
-                except (ValueError, IndexError) as e:
-                    print(f"❌ Error selecting subtitle track: {e}")
+                print(f"✅ Enabled subtitle track ID {vlc_id}: {selected}")
                     
         except Exception as e:
             print(f"❌ Error changing subtitles: {e}")
@@ -841,37 +1204,39 @@ class ShreelockVideoPlayer:
         if milliseconds <= 0:
             return "00:00"
         
-        seconds = int(milliseconds / 1000)
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        seconds = seconds % 60
-        
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes:02d}:{seconds:02d}"
+        return _format_seconds(int(milliseconds / 1000))
     
     def update_position(self):
-        """Update progress bar and time labels (runs in separate thread)"""
-        while self.update_thread_running:
-            try:
-                if self.current_file and self.is_playing:
-                    current_time = self.player.get_time()
-                    if self.duration > 0 and current_time >= 0:
-                        # Update progress bar
-                        position = (current_time / self.duration) * 100
+        """Update progress bar and time labels (reschedules itself via root.after)"""
+        self._drain_ui_calls()
+        try:
+            # Nothing to draw while the window is minimized; keep the schedule running
+            if self.current_file and self.is_playing and self._window_mapped:
+                current_time = self.player.get_time()
+                if self.duration > 0 and current_time >= 0:
+                    # Update progress bar only when it moves by at least 0.1%
+                    position = round(current_time * self._duration_pct_scale, 1)
+                    if position != self._last_pos_pct:
+                        self._last_pos_pct = position
                         self.progress_var.set(position)
-                        
-                        # Update time labels
-                        current_formatted = self.format_time(current_time)
-                        total_formatted = self.format_time(self.duration)
-                        
-                        self.root.after(0, lambda: self.current_time_label.configure(text=current_formatted))
-                        self.root.after(0, lambda: self.total_time_label.configure(text=total_formatted))
-                
-                time.sleep(0.5)  # Update every 500ms
-            except:
-                break
+                    
+                    # Update time label only when the displayed second changes
+                    # (the total is set once per file by _set_duration)
+                    cur = self.format_time(current_time)
+                    if cur != self._last_cur_str:
+                        self._last_cur_str = cur
+                        self.current_time_label.configure(text=cur)
+        except tk.TclError:
+            # Root window destroyed - stop updating
+            self._pos_after = None
+            return
+        except Exception as e:
+            # Anything else is logged and the updater keeps running
+            print(f"❌ Error updating position: {e}")
+            import traceback
+            traceback.print_exc()
+        
+        self._pos_after = self.root.after(250, self.update_position)  # Update every 250ms
     
     def clear_video(self):
         """Clear the currently loaded video and reset UI"""
@@ -881,23 +1246,29 @@ class ShreelockVideoPlayer:
             
             # Clear current file reference
             self.current_file = None
+            self._file_path = None
+            self._file_dir = None
+            self._file_stem = None
             
             # Reset UI elements
             self.info_label.configure(text="Click 'Open File' to load a video")
             self.root.title("My VLC Media Player")
             
             # Reset progress and time
-            self.duration = 0
+            self._set_duration(0)
             self.position = 0
             self.progress_var.set(0)
             self.current_time_label.configure(text="00:00")
-            self.total_time_label.configure(text="00:00")
+            self._last_cur_str = "00:00"
+            self._last_pos_pct = 0.0
             
             # Clear subtitle tracks
             self.subtitle_tracks = ["None"]
             self.subtitle_combo['values'] = self.subtitle_tracks
             self.subtitle_combo.set("None")
             self.current_subtitle = -1
+            self._subs_loaded_file = None
+            self._spu_count_seen = -1
             
             print("✅ Video cleared successfully")
             
@@ -907,7 +1278,7 @@ class ShreelockVideoPlayer:
     def toggle_fullscreen(self):
         """Toggle fullscreen mode with menu and control hiding"""
         try:
-            if not self.current_file:
+            if not self.is_fullscreen and not self.current_file:
                 messagebox.showwarning("No Video", "Please open a video file first.")
                 return
             
@@ -924,9 +1295,8 @@ class ShreelockVideoPlayer:
                 self.root.config(menu="")
                 self.menu_visible = False
                 
-                # Repack video frame to fill entire screen without margins
-                self.video_frame.pack_forget()
-                self.video_frame.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+                # Drop the video frame's margins in place (no forget + re-pack)
+                self.video_frame.pack_configure(padx=0, pady=0)
                 self.video_frame.configure(highlightthickness=0, bd=0)
                 
                 # Hide controls in fullscreen
@@ -947,9 +1317,8 @@ class ShreelockVideoPlayer:
                 # Restore original styling
                 self.root.configure(bg='black')
                 
-                # Repack video frame with minimal padding
-                self.video_frame.pack_forget()
-                self.video_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
+                # Restore the video frame's minimal padding in place
+                self.video_frame.pack_configure(pady=(0, 5))
                 
                 # Show controls when exiting fullscreen
                 self.show_controls()
@@ -958,6 +1327,7 @@ class ShreelockVideoPlayer:
                 # Stop cursor auto-hide and show cursor
                 self.stop_cursor_auto_hide()
                 self.root.configure(cursor="")
+                self._cursor_visible = True
                 
                 # Hide any visible OSD
                 self.hide_all_osd()
@@ -968,12 +1338,16 @@ class ShreelockVideoPlayer:
     
     def hide_controls(self):
         """Hide progress bar and control panel"""
+        if not self.controls_visible:
+            return
         self.progress_frame.pack_forget()
         self.controls_frame.pack_forget()
         self.controls_visible = False
     
     def show_controls(self):
         """Show progress bar and control panel"""
+        if self.controls_visible:
+            return
         self.progress_frame.pack(fill=tk.X, pady=(0, 5))
         self.controls_frame.pack(fill=tk.X)
         self.controls_visible = True
@@ -981,12 +1355,20 @@ class ShreelockVideoPlayer:
     def on_mouse_move(self, event):
         """Handle mouse movement in fullscreen with menu and control reveal"""
         if self.is_fullscreen:
-            # Show cursor when mouse moves
-            self.root.configure(cursor="")
+            # Handle at most ~60 motion events per second
+            now = time.monotonic()
+            if now - self._last_mouse_move < 0.016:
+                return
+            self._last_mouse_move = now
+            
+            # Show cursor when mouse moves (only if auto-hide actually hid it)
+            if not self._cursor_visible:
+                self.root.configure(cursor="")
+                self._cursor_visible = True
             self.mouse_moved = True
             
             # Get window dimensions
-            window_height = self.root.winfo_height()
+            window_height = self.get_root_geometry()[3]
             
             # Show menu bar when mouse moves to top
             if event.y < 50 and not self.menu_visible:  # Top 50 pixels
@@ -1010,6 +1392,32 @@ class ShreelockVideoPlayer:
             # Restart cursor hide timer
             self.start_cursor_auto_hide()
     
+    def on_root_configure(self, event):
+        """Drop cached screen/window metrics when the root window itself is reconfigured"""
+        if event.widget is self.root:
+            self._screen_size = None
+            self._root_geom = None
+    
+    def on_root_map(self, event):
+        """Track whether the root window is mapped (not minimized)"""
+        if event.widget is self.root:
+            self._window_mapped = event.type == tk.EventType.Map
+    
+    def get_screen_size(self):
+        """Screen (width, height), queried from Tk once per root geometry change"""
+        if self._screen_size is None:
+            self._screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        return self._screen_size
+    
+    def get_root_geometry(self):
+        """Root window (x, y, width, height) on screen, queried once per geometry change"""
+        if self._root_geom is None:
+            self._root_geom = (
+                self.root.winfo_rootx(), self.root.winfo_rooty(),
+                self.root.winfo_width(), self.root.winfo_height()
+            )
+        return self._root_geom
+    
     def auto_hide_controls(self):
         """Hide controls automatically after timeout"""
         if self.is_fullscreen and self.controls_visible:
@@ -1021,7 +1429,7 @@ class ShreelockVideoPlayer:
         if self.is_fullscreen and self.menu_visible:
             # Check if mouse is still at top
             x, y = self.root.winfo_pointerxy()
-            root_x, root_y = self.root.winfo_rootx(), self.root.winfo_rooty()
+            root_y = self.get_root_geometry()[1]
             relative_y = y - root_y
             
             if relative_y > 100:  # Mouse moved away from top
@@ -1032,9 +1440,9 @@ class ShreelockVideoPlayer:
         """Check if we should hide controls"""
         if self.is_fullscreen:
             # Get current mouse position
+            # Only the pointer needs a fresh query; the window geometry is cached
             x, y = self.root.winfo_pointerxy()
-            root_x, root_y = self.root.winfo_rootx(), self.root.winfo_rooty()
-            root_width, root_height = self.root.winfo_width(), self.root.winfo_height()
+            root_x, root_y, root_width, root_height = self.get_root_geometry()
             
             # Check if mouse is still in bottom area
             relative_y = y - root_y
@@ -1056,73 +1464,52 @@ class ShreelockVideoPlayer:
         """Hide cursor in fullscreen"""
         if self.is_fullscreen:
             self.root.configure(cursor="none")
+            self._cursor_visible = False
     
     def exit_fullscreen(self):
         """Exit fullscreen mode (called by Escape key)"""
         if self.is_fullscreen:
-            self.is_fullscreen = False
-            self.root.attributes('-fullscreen', False)
-            self.fullscreen_button.configure(text="⛶ Fullscreen")
-            
-            # Restore original styling
-            self.root.configure(bg='#2b2b2b')
-            
-            # Repack video frame with original padding
-            self.video_frame.pack_forget()
-            self.video_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-            
-            # Always show controls when exiting fullscreen
-            self.show_controls()
-            self.root.configure(cursor="")
-            self.stop_cursor_auto_hide()
-            
-            # Hide any visible OSD
-            self.hide_all_osd()
-            print("🪟 Exited fullscreen mode (Escape) - controls restored")
+            self.toggle_fullscreen()
     
     # Enhanced seeking methods for continuous seeking
-    def on_left_key_press(self, event):
-        """Handle left arrow key press for continuous seeking"""
+    def on_seek_key_press(self, direction):
+        """Handle left/right arrow key press (repeats while held via key auto-repeat)"""
         if self.current_file:
-            self.seeking_direction = "backward"
-            self.continuous_seek()
-    
-    def on_left_key_release(self, event):
-        """Handle left arrow key release to stop seeking"""
-        self.stop_continuous_seek()
-    
-    def on_right_key_press(self, event):
-        """Handle right arrow key press for continuous seeking"""
-        if self.current_file:
-            self.seeking_direction = "forward"
-            self.continuous_seek()
-    
-    def on_right_key_release(self, event):
-        """Handle right arrow key release to stop seeking"""
-        self.stop_continuous_seek()
+            self.seeking_direction = direction
+            # Auto-repeat presses only update the direction; one timer does the seeking
+            if self.seek_timer is None:
+                self._seek_base_time = max(self.player.get_time(), 0)
+                self._seek_accum = 0
+                self.continuous_seek()
     
     def continuous_seek(self):
-        """Perform continuous seeking while key is held"""
-        if self.seeking_direction and self.current_file:
-            current_time = self.player.get_time()
-            
-            if self.seeking_direction == "forward":
-                new_time = min(current_time + 2000, self.duration)  # 2 seconds forward
-                # Show feedback if in fullscreen
-                if self.is_fullscreen:
-                    self.show_osd("seek", "", "⏩")
-                    self.show_progress_overlay()  # Show progress bar
-            else:  # backward
-                new_time = max(current_time - 2000, 0)  # 2 seconds backward
-                # Show feedback if in fullscreen
-                if self.is_fullscreen:
-                    self.show_osd("seek", "", "⏪")
-                    self.show_progress_overlay()  # Show progress bar
+        """Perform continuous seeking while key is held (at most one seek per 100ms)"""
+        self.seek_timer = None
+        if not (self.seeking_direction and self.current_file):
+            return
+        
+        now = time.monotonic()
+        if now - self._seek_last >= 0.1:
+            self._seek_last = now
             
+            # Accumulate 2 second steps from the press-time position: one set_time() per step
+            forward = self.seeking_direction == "forward"
+            target = self._seek_base_time + self._seek_accum + (2000 if forward else -2000)
+            if forward:
+                # Duration is 0 until (or if never) the media is parsed - no upper bound then
+                new_time = min(target, self.duration) if self.duration > 0 else target
+            else:
+                new_time = max(target, 0)
+            self._seek_accum = new_time - self._seek_base_time
             self.player.set_time(new_time)
             
-            # Schedule next seek
-            self.seek_timer = self.root.after(100, self.continuous_seek)  # Every 100ms
+            # Show feedback if in fullscreen
+            if self.is_fullscreen:
+                self.show_osd("seek", "", "⏩" if forward else "⏪")
+                self.show_progress_overlay(new_time)  # Show progress bar
+        
+        # Schedule next tick
+        self.seek_timer = self.root.after(50, self.continuous_seek)
     
     def stop_continuous_seek(self):
         """Stop continuous seeking"""
@@ -1136,11 +1523,11 @@ class ShreelockVideoPlayer:
         """Handle up arrow key press for volume increase"""
         self.increase_volume()
         # Start continuous volume increase if held
-        self.volume_timer = self.root.after(500, self.continuous_volume_up)  # Start after 500ms
+        self._start_volume_repeat(10)
     
     def on_up_key_release(self, event):
         """Handle up arrow key release to stop volume increase"""
-        if hasattr(self, 'volume_timer') and self.volume_timer:
+        if self.volume_timer:
             self.root.after_cancel(self.volume_timer)
             self.volume_timer = None
     
@@ -1148,64 +1535,64 @@ class ShreelockVideoPlayer:
         """Handle down arrow key press for volume decrease"""
         self.decrease_volume()
         # Start continuous volume decrease if held
-        self.volume_timer = self.root.after(500, self.continuous_volume_down)  # Start after 500ms
+        self._start_volume_repeat(-10)
     
     def on_down_key_release(self, event):
         """Handle down arrow key release to stop volume decrease"""
-        if hasattr(self, 'volume_timer') and self.volume_timer:
+        if self.volume_timer:
             self.root.after_cancel(self.volume_timer)
             self.volume_timer = None
     
-    def continuous_volume_up(self):
-        """Continuous volume increase while key is held"""
-        if self.volume < 200:
-            self.increase_volume()
-            self.volume_timer = self.root.after(100, self.continuous_volume_up)  # Every 100ms
+    def _start_volume_repeat(self, delta):
+        """(Re)arm the held-key volume repeat, starting after 500ms"""
+        if self.volume_timer:
+            self.root.after_cancel(self.volume_timer)
+        self.volume_timer = self.root.after(500, self._volume_tick, delta)
     
-    def continuous_volume_down(self):
-        """Continuous volume decrease while key is held"""
-        if self.volume > 0:
-            self.decrease_volume()
-            self.volume_timer = self.root.after(100, self.continuous_volume_down)  # Every 100ms
+    def _volume_tick(self, delta):
+        """Continuous volume change while key is held (stops at 0 / 200)"""
+        new_volume = max(0, min(200, self.volume + delta))
+        if new_volume == self.volume:
+            self.volume_timer = None
+            return
+        
+        self.volume_var.set(new_volume)
+        self.on_volume_change(new_volume)
+        self.volume_timer = self.root.after(100, self._volume_tick, delta)  # Every 100ms
     
     def hide_all_osd(self):
-        """Hide all OSD pop-ups"""
-        for osd_type, widget in self.osd_widgets.items():
-            if widget and widget.winfo_exists():
-                widget.destroy()
-        self.osd_widgets.clear()
-        
-        # Cancel all OSD timers
-        for timer in self.osd_timers.values():
+        """Hide all OSD pop-ups (withdraw each pooled window and cancel its timer in one pass)"""
+        for osd_type, (osd, _, _) in list(self._osd_pool.items()):
+            try:
+                osd.withdraw()
+            except tk.TclError:
+                del self._osd_pool[osd_type]
+            timer = self.osd_timers.pop(osd_type, None)
             if timer:
                 self.root.after_cancel(timer)
-        self.osd_timers.clear()
     
-    def show_osd(self, osd_type, message, icon=""):
-        """Show an OSD pop-up message"""
-        # Hide existing OSD of same type
-        if osd_type in self.osd_widgets and self.osd_widgets[osd_type]:
-            try:
-                self.osd_widgets[osd_type].destroy()
-            except:
-                pass
-        
-        # Cancel existing timer for this OSD type
-        if osd_type in self.osd_timers and self.osd_timers[osd_type]:
-            self.root.after_cancel(self.osd_timers[osd_type])
-        
-        # Create different OSD styles based on type
-        if osd_type == "seek":
-            self.show_seek_arrow(message, icon)
-            return
-        
-        # Create regular OSD window for volume
+    def _build_osd(self, osd_type):
+        """Create the (hidden) OSD window for a type once; returns (window, icon label, message label)"""
         osd = tk.Toplevel(self.root)
+        osd.withdraw()
         osd.attributes('-topmost', True)
         osd.attributes('-toolwindow', True)  # Remove from taskbar
         osd.overrideredirect(True)  # Remove window decorations
         osd.configure(bg='black')
         
+        if osd_type == "seek":
+            # Minimal arrow OSD
+            arrow_label = tk.Label(
+                osd,
+                font=('Arial', 48, 'bold'),  # Large arrow
+                fg='white',
+                bg='black',
+                padx=20,
+                pady=20
+            )
+            arrow_label.pack()
+            return osd, arrow_label, None
+        
         # Create OSD content frame with semi-transparent background
         content_frame = tk.Frame(
             osd, 
@@ -1217,74 +1604,73 @@ class ShreelockVideoPlayer:
         )
         content_frame.pack(padx=10, pady=10)
         
-        # Add icon and message
-        if icon:
-            icon_label = tk.Label(
-                content_frame,
-                text=icon,
-                font=('Arial', 16, 'bold'),
-                fg='white',
-                bg='black',
-                pady=5
-            )
-            icon_label.pack()
-        
+        # Icon (packed only while one is shown) and message
+        icon_label = tk.Label(
+            content_frame,
+            font=('Arial', 16, 'bold'),
+            fg='white',
+            bg='black',
+            pady=5
+        )
         message_label = tk.Label(
             content_frame,
-            text=message,
             font=('Arial', 14, 'bold'),
             fg='white',
             bg='black',
             pady=5
         )
-        message_label.pack()
-        
-        # Position OSD on screen
-        self.position_osd(osd, osd_type)
-        
-        # Store OSD widget
-        self.osd_widgets[osd_type] = osd
-        
-        # Auto-hide after 2 seconds
-        self.osd_timers[osd_type] = self.root.after(2000, lambda: self.hide_osd(osd_type))
+        message_label.pack(side=tk.BOTTOM)
+        return osd, icon_label, message_label
     
-    def show_seek_arrow(self, message, icon):
-        """Show small seek arrow at screen edge"""
-        # Create minimal arrow OSD
-        osd = tk.Toplevel(self.root)
-        osd.attributes('-topmost', True)
-        osd.attributes('-toolwindow', True)
-        osd.overrideredirect(True)
-        osd.configure(bg='black')
+    def _get_osd(self, osd_type):
+        """Return the pooled OSD widgets for a type, building them on first use"""
+        entry = self._osd_pool.get(osd_type)
+        if entry is None:
+            entry = self._osd_pool[osd_type] = self._build_osd(osd_type)
+        return entry
+    
+    def show_osd(self, osd_type, message, icon=""):
+        """Show an OSD pop-up message"""
+        # Cancel existing timer for this OSD type; it is re-armed below
+        if self.osd_timers.get(osd_type):
+            self.root.after_cancel(self.osd_timers[osd_type])
         
-        # Create simple arrow display
-        arrow_label = tk.Label(
-            osd,
-            text=icon,
-            font=('Arial', 48, 'bold'),  # Large arrow
-            fg='white',
-            bg='black',
-            padx=20,
-            pady=20
-        )
-        arrow_label.pack()
+        try:
+            self._fill_osd(osd_type, message, icon)
+        except tk.TclError:
+            # The pooled window was destroyed behind our back - evict it and rebuild once
+            self._osd_pool.pop(osd_type, None)
+            self._fill_osd(osd_type, message, icon)
         
-        # Position arrow at screen edge
-        self.position_seek_arrow(osd, icon)
+        # Auto-hide after 2 seconds (1 second for seek arrows)
+        delay = 1000 if osd_type == "seek" else 2000
+        self.osd_timers[osd_type] = self.root.after(delay, self.hide_osd, osd_type)
+    
+    def _fill_osd(self, osd_type, message, icon):
+        """Update the pooled OSD's labels, position it and show it"""
+        osd, icon_label, message_label = self._get_osd(osd_type)
         
-        # Store OSD widget
-        self.osd_widgets["seek"] = osd
+        if osd_type == "seek":
+            # Small seek arrow at the screen edge
+            icon_label.configure(text=icon)
+            self.position_seek_arrow(osd, icon)
+        else:
+            if icon:
+                icon_label.configure(text=icon)
+                icon_label.pack(side=tk.TOP)
+            else:
+                icon_label.pack_forget()
+            message_label.configure(text=message)
+            self.position_osd(osd, osd_type)
         
-        # Auto-hide after 1 second (shorter for arrows)
-        self.osd_timers["seek"] = self.root.after(1000, lambda: self.hide_osd("seek"))
+        osd.deiconify()
     
     def position_seek_arrow(self, osd, icon):
         """Position seek arrow at screen edge"""
         osd.update_idletasks()
         
         # Get screen dimensions
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
+        screen_width, screen_height = self.get_screen_size()
         
         # Get OSD dimensions
         osd_width = osd.winfo_reqwidth()
@@ -1307,8 +1693,7 @@ class ShreelockVideoPlayer:
         osd.update_idletasks()  # Ensure size is calculated
         
         # Get screen dimensions
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
+        screen_width, screen_height = self.get_screen_size()
         
         # Get OSD dimensions
         osd_width = osd.winfo_reqwidth()
@@ -1330,29 +1715,22 @@ class ShreelockVideoPlayer:
         osd.geometry(f"{osd_width}x{osd_height}+{x}+{y}")
     
     def hide_osd(self, osd_type):
-        """Hide specific OSD pop-up"""
-        if osd_type in self.osd_widgets and self.osd_widgets[osd_type]:
+        """Hide specific OSD pop-up (withdrawn, kept in the pool for the next show)"""
+        entry = self._osd_pool.get(osd_type)
+        if entry:
             try:
-                self.osd_widgets[osd_type].destroy()
-            except:
-                pass
-            del self.osd_widgets[osd_type]
+                entry[0].withdraw()
+            except tk.TclError:
+                del self._osd_pool[osd_type]
         
-        if osd_type in self.osd_timers:
-            if self.osd_timers[osd_type]:
-                self.root.after_cancel(self.osd_timers[osd_type])
-            del self.osd_timers[osd_type]
+        timer = self.osd_timers.pop(osd_type, None)
+        if timer:
+            self.root.after_cancel(timer)
     
-    def show_progress_overlay(self):
-        """Show progress bar overlay in fullscreen"""
-        if not self.is_fullscreen or not self.player.get_media():
-            return
-            
-        # Hide existing overlay
-        self.hide_progress_overlay()
-        
-        # Create progress overlay window
+    def _build_progress_overlay(self):
+        """Create the fullscreen progress overlay once (hidden); later shows only update it"""
         self.progress_overlay = tk.Toplevel(self.root)
+        self.progress_overlay.withdraw()
         self.progress_overlay.overrideredirect(True)
         self.progress_overlay.configure(bg='black')
         self.progress_overlay.attributes('-topmost', True)
@@ -1361,36 +1739,55 @@ class ShreelockVideoPlayer:
         progress_frame = tk.Frame(self.progress_overlay, bg='black', padx=20, pady=10)
         progress_frame.pack()
         
-        # Current time and duration
-        current_time = self.player.get_time()
-        total_time = self.player.get_length()
-        
-        if total_time > 0:
-            progress_percent = (current_time / total_time) * 100
-        else:
-            progress_percent = 0
-        
         # Time labels
         time_frame = tk.Frame(progress_frame, bg='black')
         time_frame.pack(fill=tk.X)
         
-        current_str = self.format_time(current_time)
-        total_str = self.format_time(total_time)
-        
-        tk.Label(time_frame, text=current_str, fg='white', bg='black', 
-                font=('Arial', 10)).pack(side=tk.LEFT)
-        tk.Label(time_frame, text=total_str, fg='white', bg='black', 
-                font=('Arial', 10)).pack(side=tk.RIGHT)
+        self._po_cur_lbl = tk.Label(time_frame, text="00:00", fg='white', bg='black', 
+                font=('Arial', 10))
+        self._po_cur_lbl.pack(side=tk.LEFT)
+        self._po_tot_lbl = tk.Label(time_frame, text="00:00", fg='white', bg='black', 
+                font=('Arial', 10))
+        self._po_tot_lbl.pack(side=tk.RIGHT)
         
         # Progress bar
         progress_bg = tk.Frame(progress_frame, bg='#404040', height=6)
         progress_bg.pack(fill=tk.X, pady=(5, 0))
         
-        progress_fill = tk.Frame(progress_bg, bg='#0078D4', height=6)
-        progress_fill.place(x=0, y=0, relwidth=progress_percent/100, relheight=1)
+        self._po_fill = tk.Frame(progress_bg, bg='#0078D4', height=6)
+        self._po_fill.place(x=0, y=0, relwidth=0, relheight=1)
+    
+    def show_progress_overlay(self, current_time=None):
+        """Show progress bar overlay in fullscreen"""
+        if not self.is_fullscreen or not self.current_file:
+            return
+        
+        if self.progress_overlay is None:
+            self._build_progress_overlay()
+        
+        # Cancel the pending hide; it is re-armed below
+        if self.progress_hide_timer:
+            self.root.after_cancel(self.progress_hide_timer)
+            self.progress_hide_timer = None
+        
+        # Current time (callers that just seeked pass the target) and duration
+        # (fixed once the media is parsed in load_video)
+        if current_time is None:
+            current_time = self.player.get_time()
+        total_time = self.duration
+        
+        if total_time > 0:
+            progress_percent = (current_time / total_time) * 100
+        else:
+            progress_percent = 0
+        
+        self._po_cur_lbl.configure(text=self.format_time(current_time))
+        self._po_tot_lbl.configure(text=self._duration_str)
+        self._po_fill.place_configure(relwidth=progress_percent/100)
         
         # Position overlay at bottom center
         self.position_progress_overlay()
+        self.progress_overlay.deiconify()
         
         # Auto-hide after 2 seconds
         self.progress_hide_timer = self.root.after(2000, self.hide_progress_overlay)
@@ -1402,8 +1799,7 @@ class ShreelockVideoPlayer:
             
         self.progress_overlay.update_idletasks()
         
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
+        screen_width, screen_height = self.get_screen_size()
         
         overlay_width = self.progress_overlay.winfo_reqwidth()
         overlay_height = self.progress_overlay.winfo_reqheight()
@@ -1414,18 +1810,27 @@ class ShreelockVideoPlayer:
         self.progress_overlay.geometry(f"{overlay_width}x{overlay_height}+{x}+{y}")
     
     def hide_progress_overlay(self):
-        """Hide progress overlay"""
+        """Hide progress overlay (withdrawn, kept for the next show)"""
         if self.progress_overlay:
             try:
-                self.progress_overlay.destroy()
-            except:
-                pass
-            self.progress_overlay = None
+                self.progress_overlay.withdraw()
+            except tk.TclError:
+                self.progress_overlay = None
         
         if self.progress_hide_timer:
             self.root.after_cancel(self.progress_hide_timer)
             self.progress_hide_timer = None
     
+    @functools.cached_property
+    def desktop_shortcut(self):
+        """Desktop .lnk path, resolved on first use (known-folder lookup happens here)"""
+        return os.path.join(_desktop_dir(), self.SHORTCUT_NAME)
+    
+    @functools.cached_property
+    def start_menu_shortcut(self):
+        """Start Menu .lnk path, resolved on first use"""
+        return os.path.join(_start_menu_programs_dir(), self.SHORTCUT_NAME)
+    
     def create_shortcuts(self):
         """Create desktop and start menu shortcuts for the application"""
         try:
@@ -1439,27 +1844,18 @@ class ShreelockVideoPlayer:
                 messagebox.showwarning("Warning", "This feature is designed for the compiled executable version.")
                 return
             
-            # Get user directories
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
-            start_menu_path = os.path.join(
-                os.environ.get("APPDATA", ""), 
-                "Microsoft", "Windows", "Start Menu", "Programs"
-            )
-            
             created_shortcuts = []
             
             # Create desktop shortcut
             try:
-                desktop_shortcut = os.path.join(desktop_path, "Shreelock Video Player.lnk")
-                self._create_windows_shortcut(exe_path, desktop_shortcut, "Professional video player with smart controls")
+                self._create_windows_shortcut(exe_path, self.desktop_shortcut, "Professional video player with smart controls")
                 created_shortcuts.append("Desktop")
             except Exception as e:
                 print(f"Failed to create desktop shortcut: {e}")
             
             # Create start menu shortcut
             try:
-                start_menu_shortcut = os.path.join(start_menu_path, "Shreelock Video Player.lnk")
-                self._create_windows_shortcut(exe_path, start_menu_shortcut, "Professional video player with smart controls")
+                self._create_windows_shortcut(exe_path, self.start_menu_shortcut, "Professional video player with smart controls")
                 created_shortcuts.append("Start Menu")
             except Exception as e:
                 print(f"Failed to create start menu shortcut: {e}")
@@ -1482,11 +1878,37 @@ class ShreelockVideoPlayer:
             messagebox.showerror("Error", f"Failed to create shortcuts: {str(e)}")
     
     def _create_windows_shortcut(self, target_path, shortcut_path, description):
-        """Create a Windows shortcut (.lnk file) using PowerShell with play button icon"""
+        """Create a Windows shortcut (.lnk file) with play button icon"""
+        # Get the play button icon
+        icon_source = create_play_icon()
+        
+        # SHREELOCK_SHORTCUT_DIR subfolders may not exist yet
+        os.makedirs(os.path.dirname(shortcut_path), exist_ok=True)
+        
+        # In-process COM call when pywin32 is available (no PowerShell start-up)
+        try:
+            from win32com.client import Dispatch
+        except ImportError:
+            Dispatch = None
+        
+        if Dispatch is not None:
+            try:
+                shortcut = Dispatch("WScript.Shell").CreateShortcut(shortcut_path)
+                shortcut.TargetPath = target_path
+                shortcut.Description = description
+                shortcut.WorkingDirectory = os.path.dirname(target_path)
+                if icon_source:
+                    shortcut.IconLocation = icon_source
+                shortcut.Save()
+                return
+            except Exception as e:
+                print(f"⚠️ COM shortcut creation failed, falling back to PowerShell: {e}")
+        
+        self._create_windows_shortcut_powershell(target_path, shortcut_path, description, icon_source)
+    
+    def _create_windows_shortcut_powershell(self, target_path, shortcut_path, description, icon_source):
+        """Create a Windows shortcut (.lnk file) using PowerShell"""
         try:
-            # Get the play button icon
-            icon_source = create_play_icon()
-            
             # Use PowerShell to create the shortcut
             powershell_script = f'''
 $WshShell = New-Object -comObject WScript.Shell
@@ -1504,98 +1926,103 @@ $Shortcut.IconLocation = "{icon_source}"'''
 $Shortcut.Save()
 '''
             
-            # Write the PowerShell script to a temporary file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.ps1', delete=False) as temp_file:
-                temp_file.write(powershell_script)
-                temp_script_path = temp_file.name
+            # Pipe the script over stdin (no temp .ps1 file); skip the user profile
+            import subprocess
+            result = subprocess.run([
+                'powershell', '-NoProfile', '-NonInteractive',
+                '-ExecutionPolicy', 'Bypass', '-Command', '-'
+            ], input=powershell_script, capture_output=True, text=True, timeout=10)
             
-            try:
-                # Execute the PowerShell script
-                import subprocess
-                result = subprocess.run([
-                    'powershell', '-ExecutionPolicy', 'Bypass', '-File', temp_script_path
-                ], capture_output=True, text=True, timeout=10)
-                
-                if result.returncode != 0:
-                    raise Exception(f"PowerShell execution failed: {result.stderr}")
-                    
-            finally:
-                # Clean up temporary script file
-                try:
-                    os.unlink(temp_script_path)
-                except:
-                    pass
+            if result.returncode != 0:
+                raise Exception(f"PowerShell execution failed: {result.stderr}")
                     
         except Exception as e:
             raise Exception(f"Failed to create shortcut: {str(e)}")
 
     def uninstall_shortcuts(self):
         """Remove desktop and start menu shortcuts for the application"""
-        try:
-            # Get user directories
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
-            start_menu_path = os.path.join(
-                os.environ.get("APPDATA", ""), 
-                "Microsoft", "Windows", "Start Menu", "Programs"
+        targets = (("Desktop", self.desktop_shortcut), ("Start Menu", self.start_menu_shortcut))
+        
+        def remove_all():
+            # One pass over both shortcuts, off the Tk thread
+            removed, failed = [], []
+            for label, path in targets:
+                try:
+                    os.remove(path)
+                    removed.append(label)
+                except FileNotFoundError:
+                    pass  # Nothing to remove
+                except OSError as e:
+                    print(f"Failed to remove {label} shortcut: {e}")
+                    failed.append(f"{label}: {e}")
+            self._ui_calls.put((self._show_uninstall_result, removed, failed))
+        
+        threading.Thread(target=remove_all, daemon=True).start()
+    
+    def _show_uninstall_result(self, removed, failed):
+        """Report the outcome of uninstall_shortcuts in a single dialog"""
+        if failed:
+            removed_text = f"Removed: {' and '.join(removed)}\n\n" if removed else ""
+            messagebox.showerror(
+                "Error",
+                f"{removed_text}Failed to uninstall shortcuts:\n" + "\n".join(failed)
+            )
+        elif removed:
+            locations = " and ".join(removed)
+            messagebox.showinfo(
+                "Shortcuts Removed", 
+                f"Successfully removed shortcuts from: {locations}\n\n"
+                "Shreelock Video Player shortcuts have been uninstalled."
+            )
+        else:
+            messagebox.showinfo(
+                "No Shortcuts Found", 
+                "No shortcuts were found to remove.\n\n"
+                "They may have been already deleted or never created."
             )
-            
-            # Define shortcut paths
-            desktop_shortcut = os.path.join(desktop_path, "Shreelock Video Player.lnk")
-            start_menu_shortcut = os.path.join(start_menu_path, "Shreelock Video Player.lnk")
-            
-            removed_shortcuts = []
-            
-            # Remove desktop shortcut
-            try:
-                if os.path.exists(desktop_shortcut):
-                    os.remove(desktop_shortcut)
-                    removed_shortcuts.append("Desktop")
-            except Exception as e:
-                print(f"Failed to remove desktop shortcut: {e}")
-            
-            # Remove start menu shortcut
-            try:
-                if os.path.exists(start_menu_shortcut):
-                    os.remove(start_menu_shortcut)
-                    removed_shortcuts.append("Start Menu")
-            except Exception as e:
-                print(f"Failed to remove start menu shortcut: {e}")
-            
-            # Show result message
-            if removed_shortcuts:
-                locations = " and ".join(removed_shortcuts)
-                messagebox.showinfo(
-                    "Shortcuts Removed", 
-                    f"Successfully removed shortcuts from: {locations}\n\n"
-                    "Shreelock Video Player shortcuts have been uninstalled."
-                )
-            else:
-                messagebox.showinfo(
-                    "No Shortcuts Found", 
-                    "No shortcuts were found to remove.\n\n"
-                    "They may have been already deleted or never created."
-                )
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to uninstall shortcuts: {str(e)}")
 
-    def on_closing(self):
-        """Handle application closing"""
-        # Stop all timers and threads
-        self.update_thread_running = False
+    def _shutdown_ui(self):
+        """Cancel every pending UI timer and hide the fullscreen pop-ups"""
         self.stop_continuous_seek()
         self.stop_cursor_auto_hide()
         self.hide_all_osd()  # Clean up OSD windows
         self.hide_progress_overlay()  # Clean up progress overlay
         
-        # Stop volume timers if they exist
-        if hasattr(self, 'volume_timer') and self.volume_timer:
+        # Stop the position updater (which also drains queued UI calls)
+        if self._pos_after:
+            self.root.after_cancel(self._pos_after)
+            self._pos_after = None
+        
+        # Stop volume timer
+        if self.volume_timer:
             self.root.after_cancel(self.volume_timer)
+            self.volume_timer = None
+    
+    def on_closing(self):
+        """Handle application closing"""
+        self._shutdown_ui()
         
-        # Stop the player and destroy window
-        self.player.stop()
+        # libvlc's stop() can block on the decoder threads; don't hold the window open for it.
+        # release_player() waits for it after mainloop returns.
+        self._stop_thread = threading.Thread(target=self.player.stop, daemon=True)
+        self._stop_thread.start()
         self.root.destroy()
+    
+    def release_player(self, timeout=2.0):
+        """Wait (briefly) for the background stop, then release the player and libvlc instance"""
+        global _VLC_INSTANCE
+        if self._stop_thread is None:
+            return
+        
+        self._stop_thread.join(timeout)
+        if self._stop_thread.is_alive():
+            print("⚠️ VLC is still stopping - exiting without releasing it")
+            return
+        
+        self.player.release()
+        if _VLC_INSTANCE is not None:
+            _VLC_INSTANCE.release()
+            _VLC_INSTANCE = None
 
 def main():
     """Main application entry point"""
@@ -1607,6 +2034,9 @@ def main():
     
     # Start the application
     root.mainloop()
+    
+    # The window is gone; let VLC finish stopping before the interpreter exits
+    app.release_player()
 
 if __name__ == "__main__":
     main()